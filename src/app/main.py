@@ -30,6 +30,32 @@ st.write("Generate synthetic data for your applications.")
 # Define possible datatypes
 DATATYPES = list(Datatype._registry.keys())
 
+# Templates for the schema tables. Streamlit reruns this whole script on every interaction, so the
+# templates are built once by cached factories and shared across reruns. Callers must not modify them.
+@st.cache_resource
+def _initial_template() -> pd.DataFrame:
+    return pd.DataFrame({
+        "name": ["ID"],
+        "datatype": ["Integer"],
+        "length": [None],
+        "domain": [None],
+        "max": [None],
+        "min": [None],
+        "completeness": [1],
+    })
+
+@st.cache_resource
+def _empty_row() -> pd.DataFrame:
+    return pd.DataFrame({
+        "name": ["New Column"],
+        "datatype": ["String"],
+        "length": [None],
+        "domain": [None],
+        "max": [None],
+        "min": [None],
+        "completeness": [None],
+    })
+
 def config_from_dataframe(df, table_name: str = "default"):
     """
     Function to configure the grid options from a dataframe.
@@ -78,15 +104,7 @@ def update_function(table_name: str = "default") -> callable:
     Function searches the session state for the table name and returns a function which updates the table schema.
     """
     if table_name not in st.session_state.tables:
-        st.session_state.tables[table_name] = pd.DataFrame({
-            "name": ["ID"],
-            "datatype": ["Integer"],
-            "length": [None],
-            "domain": [None],
-            "max": [None],
-            "min": [None],
-            "completeness": [1],
-        })
+        st.session_state.tables[table_name] = get_initial_table()
     
     def update_table_schema() -> pd.DataFrame:
         """
@@ -107,34 +125,19 @@ def add_row(table_name: str) -> None:
     if table_name not in st.session_state.tables:
         raise ValueError(f"Table {table_name} not found in session state.")
     
-    new_row = pd.DataFrame({
-        "name": ["New Column"],
-        "datatype": ["String"],
-        "length": [None],
-        "domain": [None],
-        "max": [None],
-        "min": [None],
-        "completeness": [None],
-    })
-    st.session_state.tables[table_name] = pd.concat([st.session_state.tables[table_name], new_row], ignore_index=True)
+    st.session_state.tables[table_name] = pd.concat([st.session_state.tables[table_name], _empty_row()], ignore_index=True)
 
-@st.cache_data
 def get_initial_table():
-    return pd.DataFrame({
-        "name": ["ID"],
-        "datatype": ["Integer"],
-        "length": [None],
-        "domain": [None],
-        "max": [None],
-        "min": [None],
-        "completeness": [1],
-    })
+    return _initial_template().copy(deep=False)
 
 # Create a cache of tables if none exists
 if "tables" not in st.session_state:
     st.session_state.tables = {"default": get_initial_table()}
 if "tables_grid" not in st.session_state:
     st.session_state.tables_grid = {}
+# Cache of ColumnSchema objects per table, so that unchanged schema rows are not rebuilt on each rerun
+if "column_caches" not in st.session_state:
+    st.session_state.column_caches = {}
 
 
 def table_section(table_name: str) -> None:
@@ -157,7 +160,9 @@ def table_section(table_name: str) -> None:
         #     st.session_state[f"update{table_name}"] = False
 
         if st.button(f"Generate Data for {table_name}", key=f"generate_{table_name}"):
-            table_schema = TableSchema.from_dataframe(updated_df)
+            table_schema = TableSchema.from_dataframe(
+                updated_df, column_cache=st.session_state.column_caches.setdefault(table_name, {})
+            )
             df = table_schema.generate()
             st.write("Generated Data:")
             st.write(df)
@@ -0,0 +1,36 @@
+"""
+Compiled kernels for the hot paths of the column generators.
+
+If numba is installed, the kernels are compiled in nopython mode and take the caller's
+`np.random.Generator` as an argument, so they draw from the same stream as the rest of the table.
+Otherwise, we fall back to the equivalent NumPy expressions.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _scaled_integers_numpy(rng: np.random.Generator, low: int, high: int, n: int, scale: int) -> np.ndarray:
+    """
+    Draws `n` integers in [low, high] and divides them by `scale`, giving floats on a grid of 1/scale.
+    """
+    return rng.integers(low, high + 1, n, dtype=np.int64) / scale
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _scaled_integers_numba(rng, low, high, n, scale):
+        # Draw, bound and scale each value in a single pass, without the temporary integer array
+        # NumPy needs. Flooring a uniform float is uniform over the integers to within 2**-53.
+        out = np.empty(n, dtype=np.float64)
+        span = high - low + 1
+        for i in range(n):
+            out[i] = (low + min(np.floor(rng.random() * span), span - 1)) / scale
+        return out
+
+    scaled_integers = _scaled_integers_numba
+else:
+    scaled_integers = _scaled_integers_numpy
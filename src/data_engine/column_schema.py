@@ -1,9 +1,10 @@
 import random
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 from faker import Faker
 import numpy as np
 import pandas as pd
 import inspect
+import functools
 
 from data_engine.datatypes import Datatype
 from data_engine.datatypes import (
@@ -19,6 +20,16 @@ from data_engine.datatypes import (
     # NameType, 
 )
 
+
+@functools.lru_cache(maxsize=None)
+def _valid_kwargs(datatype_class: type) -> frozenset:
+    """
+    Returns the names of the arguments accepted by a datatype class constructor.
+    Inspecting a signature is slow, so the result is cached per class.
+    """
+    return frozenset(inspect.signature(datatype_class.__init__).parameters)
+
+
 class ColumnSchema:
     """
     Represents a series of data in a column of a table. Each column is equipped with rules to determine how the data should be generated.
@@ -29,7 +40,11 @@ class ColumnSchema:
         completeness (float): The percentage of non-null values in the column. 1 by default (no null values).
         generator_rule (Callable): A Faker function which randomly generates the data for the column. If `None`, then the default generator will be used.
         datatype_kwargs (dict): Additional keyword arguments for the datatype class (e.g. length for StringType, categories for CategoryType).
+        generate (Callable): Generates a single value for the column. This is built from the rules above when the
+            column is created, so it must be rebuilt with `_make_generator` if they are changed afterwards.
     """
+    __slots__ = ("name", "datatype", "completeness", "generator_rule", "generate")
+
     def __init__(
         self,
         name: str,
@@ -45,11 +60,11 @@ class ColumnSchema:
             datatype = StringType()
         elif isinstance(datatype, str):
             # If a string is provided, we convert it to the corresponding Datatype class.
-            datatype_class = Datatype.get_class(datatype.lower())
+            datatype_class = Datatype.get_class(datatype)
             if datatype_class is None:
                 raise ValueError(f"Unknown datatype: {datatype}.")
             # Filter out invalid arguments for the datatype class
-            valid_args = inspect.signature(datatype_class.__init__).parameters
+            valid_args = _valid_kwargs(datatype_class)
             filtered_kwargs = {k: v for k, v in datatype_kwargs.items() if k in valid_args}
             
             datatype = datatype_class(**filtered_kwargs)
@@ -61,26 +76,62 @@ class ColumnSchema:
             completeness = 1.0
         self.completeness = completeness
         self.generator_rule = generator_rule
+        self.generate = self._make_generator()
         
     def __str__(self) -> str:
-        return f"ColumnSchema({','.join(f'{k}={v}' for k, v in self.__dict__.items())})"
+        fields = ("name", "datatype", "completeness", "generator_rule")
+        return f"ColumnSchema({','.join(f'{k}={getattr(self, k)}' for k in fields)})"
     
     def __repr__(self) -> str:
         return self.__str__()
 
-    def generate(self, *args):
+    def __getstate__(self) -> tuple:
+        # The specialized generator may be a closure, which cannot be pickled, so we rebuild it on unpickling.
+        return (self.name, self.datatype, self.completeness, self.generator_rule)
+
+    def __setstate__(self, state: tuple) -> None:
+        self.name, self.datatype, self.completeness, self.generator_rule = state
+        self.generate = self._make_generator()
+
+    def _make_generator(self) -> Callable[..., object]:
         """
-        Generates a value for the column based on the specified rules.
+        Builds a function which generates a single value for the column based on the specified rules.
+        The checks on the rules are made once here, rather than every time a value is generated.
+        Like the original `generate` method, the function accepts and ignores any positional arguments.
         """
-        # When completeness is not 100%, we set the output to None with a probability of (1 - completeness).
-        provide_null_value = random.random() > self.completeness
-        if provide_null_value and self.completeness < 1.0:
-            return None
-                
         # If we have a generator rule, we use it to generate the value.
-        if self.generator_rule is not None:
-            return self.generator_rule()
-        
         # If we don't have a generator rule, we use the default generator based on the datatype.
-        return self.datatype.generator_rule()
-    
+        rule = self.generator_rule if self.generator_rule is not None else self.datatype.generator_rule
+        if self.completeness >= 1.0:
+            def generate(*args):
+                return rule()
+            return generate
+
+        # When completeness is not 100%, we set the output to None with a probability of (1 - completeness).
+        completeness = self.completeness
+        rand = random.random
+        def generate(*args):
+            return None if rand() > completeness else rule()
+        return generate
+
+    def generate_array(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Generates an array of `n` values for the column based on the specified rules.
+        """
+        # If we have a generator rule, we have no choice but to call it once per value.
+        if self.generator_rule is not None:
+            col = np.empty(n, dtype=object)
+            rule = self.generator_rule
+            for i in range(n):
+                col[i] = rule()
+            if self.completeness < 1.0:
+                col[rng.random(n) > self.completeness] = None
+            return col
+
+        col = self.datatype.generate_array(n, rng)
+
+        # When completeness is not 100%, we null out each value with a probability of (1 - completeness).
+        # A single mask is drawn for the whole column and the datatype decides how to represent the nulls.
+        if self.completeness < 1.0:
+            col = self.datatype.with_nulls(col, rng.random(n) > self.completeness)
+        return col
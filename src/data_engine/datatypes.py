@@ -1,6 +1,18 @@
 import random
 import string
 from typing import Type, Optional
+import numpy as np
+import pandas as pd
+
+from data_engine._fast import scaled_integers
+
+# The alphabet used for random strings, as an array of bytes so that it can be sampled in bulk.
+_ALPHABET_BYTES = np.frombuffer((string.ascii_letters + string.digits).encode(), dtype=np.uint8)
+
+# Generator used for single values produced by `generator_rule`. Bulk generation via `generate_array`
+# is passed a NumPy generator by the table schema instead. The stdlib generator is several times
+# cheaper per draw than a NumPy generator, whose advantage only shows when drawing in bulk.
+_random = random.Random()
 
 class Datatype:
     """
@@ -8,6 +20,8 @@ class Datatype:
     This class is not meant to be instantiated directly, but rather to be subclassed by specific data types.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         """
         Initializes the datatype object. Must be called by subclasses.
@@ -21,6 +35,28 @@ class Datatype:
         This will need to be implemented by subclasses.
         """
         raise NotImplementedError("Subclasses must implement this method.")
+
+    def generate_array(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Generates an array of `n` random values of the specified type.
+        Subclasses should override this with a vectorized implementation; by default we fall back
+        to calling `generator_rule` once per value.
+        """
+        # Fill a preallocated array rather than building an intermediate list of values to copy from.
+        values = np.empty(n, dtype=object)
+        rule = self.generator_rule
+        for i in range(n):
+            values[i] = rule()
+        return values
+
+    def with_nulls(self, values: np.ndarray, mask: np.ndarray):
+        """
+        Sets the values of an array generated by `generate_array` to null wherever `mask` is True.
+        Subclasses may override this to use a nullable array type rather than an object array.
+        """
+        values = values.astype(object)
+        values[mask] = None
+        return values
     
     def __str__(self):
         """
@@ -30,6 +66,8 @@ class Datatype:
     
     
     _registry: dict[str, Type["Datatype"]] = {}
+    # Lower-cased copy of the registry, so that lookups are case-insensitive with a single dict access.
+    _registry_lc: dict[str, Type["Datatype"]] = {}
 
     @classmethod
     def register(cls, *names: str):
@@ -37,15 +75,17 @@ class Datatype:
         def wrapper(subclass: Type["Datatype"]):
             for name in names:
                 cls._registry[name] = subclass
+                cls._registry_lc[name.lower()] = subclass
             return subclass
         return wrapper
 
     @classmethod
     def get_class(cls, name: str) -> "Datatype":
-        """Returns a subclass based on a string identifier."""
-        if name in cls._registry:
-            return cls._registry[name]
-        raise ValueError(f"Unknown datatype: {name}")
+        """Returns a subclass based on a case-insensitive string identifier."""
+        try:
+            return cls._registry_lc[name.lower()]
+        except KeyError:
+            raise ValueError(f"Unknown datatype: {name}") from None
     
 
 @Datatype.register("string")
@@ -53,9 +93,17 @@ class StringType(Datatype):
     """
     A class representing a string data type.
     """
-    def __init__(self, length: int = 10):
+    __slots__ = ("length", "fast")
+
+    _ALPHA = string.ascii_letters + string.digits
+
+    def __init__(self, length: int = 10, fast: bool = False):
         """
         Initializes the StringType object with a specified length.
+
+        If `fast` is True, columns are generated from raw random bytes reduced modulo the alphabet size.
+        This is quicker for large tables, but slightly biased: since 256 is not a multiple of 62, the
+        first 8 characters of the alphabet ("a" to "h") are each drawn with probability 5/256 rather than 4/256.
         """
         super().__init__()
         if length is None:
@@ -63,12 +111,35 @@ class StringType(Datatype):
         if length <= 0:
             raise ValueError("Length must be a positive integer.")
         self.length = length
+        self.fast = fast
 
     def generator_rule(self):
         """
         Generates a random string of the specified length.
         """
-        return ''.join(random.choices(string.ascii_letters + string.digits, k=self.length))
+        # Draw 6 random bits per character and reject the 2 values out of 64 which fall outside the
+        # alphabet. This is cheaper than `random.choices` and keeps every character equally likely.
+        getrandbits = _random.getrandbits
+        alpha = self._ALPHA
+        chars = []
+        while len(chars) < self.length:
+            i = getrandbits(6)
+            if i < 62:
+                chars.append(alpha[i])
+        return ''.join(chars)
+
+    def generate_array(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Generates an array of `n` random strings of the specified length.
+        """
+        # Draw an (n, length) grid of indices into the alphabet in one go, gather the
+        # corresponding bytes and view each row as a single fixed-width string.
+        if self.fast:
+            # Skip the bounded draw and take random bytes modulo the alphabet size (see __init__).
+            idx = np.frombuffer(rng.bytes(n * self.length), dtype=np.uint8) % len(_ALPHABET_BYTES)
+        else:
+            idx = rng.integers(0, len(_ALPHABET_BYTES), (n, self.length), dtype=np.uint8)
+        return _ALPHABET_BYTES[idx].view(f"S{self.length}").ravel().astype(f"U{self.length}")
     
 
 @Datatype.register("int", "integer")
@@ -76,6 +147,8 @@ class IntegerType(Datatype):
     """
     A class representing an integer data type.
     """
+    __slots__ = ("min_value", "max_value", "_dtype")
+
     def __init__(self, min_value: int = 0, max_value: int = 100):
         """
         Initializes the IntegerType object with a specified range.
@@ -94,12 +167,43 @@ class IntegerType(Datatype):
         
         self.min_value = int(min_value)
         self.max_value = int(max_value)
+        # Use the narrowest integer type which can hold every value in the range. NumPy cannot draw
+        # beyond 64 bits, so wider ranges have no dtype and fall back to Python integers.
+        self._dtype = next(
+            (
+                dtype for dtype in (np.int8, np.int16, np.int32, np.int64)
+                if np.iinfo(dtype).min <= self.min_value and self.max_value <= np.iinfo(dtype).max
+            ),
+            None,
+        )
 
     def generator_rule(self):
         """
         Generates a random integer within the specified range.
         """
-        return random.randint(self.min_value, self.max_value)
+        return _random.randint(self.min_value, self.max_value)
+
+    def generate_array(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Generates an array of `n` random integers within the specified range.
+        """
+        if self._dtype is None:
+            # NumPy cannot draw beyond 64 bits, so we draw Python integers one at a time instead, from a
+            # stdlib generator seeded from `rng` so that seeded tables stay reproducible.
+            randint = random.Random(int(rng.integers(2**63))).randint
+            values = np.empty(n, dtype=object)
+            for i in range(n):
+                values[i] = randint(self.min_value, self.max_value)
+            return values
+        return rng.integers(self.min_value, self.max_value + 1, n, dtype=self._dtype)
+
+    def with_nulls(self, values: np.ndarray, mask: np.ndarray) -> pd.arrays.IntegerArray:
+        """
+        Wraps the integers in a nullable integer array, masked wherever `mask` is True.
+        """
+        if self._dtype is None:
+            return super().with_nulls(values, mask)
+        return pd.arrays.IntegerArray(values, mask)
     
 
 @Datatype.register("float")
@@ -107,9 +211,12 @@ class FloatType(Datatype):
     """
     A class representing a float data type.
     """
-    def __init__(self, min_value: float = 0.0, max_value: float = 100.0):
+    __slots__ = ("min_value", "max_value", "_dtype")
+
+    def __init__(self, min_value: float = 0.0, max_value: float = 100.0, precision: str = "float64"):
         """
         Initializes the FloatType object with a specified range.
+        The precision ("float32" or "float64") sets the dtype of generated columns.
         """
         super().__init__()
         if min_value is None and max_value is None:
@@ -120,14 +227,41 @@ class FloatType(Datatype):
         elif min_value is None and max_value is not None:
             min_value = min(max_value-100.0, 0.0)
         
+        if min_value >= max_value:
+            raise ValueError("min_value must be less than max_value.")
+        if precision not in ("float32", "float64"):
+            raise ValueError("precision must be 'float32' or 'float64'.")
+        
         self.min_value = min_value
         self.max_value = max_value
+        self._dtype = np.dtype(precision)
 
     def generator_rule(self):
         """
         Generates a random float within the specified range.
         """
-        return round(random.uniform(self.min_value, self.max_value), 2)
+        return round(_random.uniform(self.min_value, self.max_value), 2)
+
+    def generate_array(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Generates an array of `n` random floats within the specified range.
+        """
+        # Rather than drawing floats and rounding each one, draw whole numbers of hundredths and
+        # scale them down once. This gives the same 2 decimal place values as rounding would.
+        low, high = round(self.min_value * 100), round(self.max_value * 100)
+        if high - low < 2**53:
+            values = scaled_integers(rng, low, high, n, 100)
+        else:
+            # Wider ranges do not fit the integer draw (and cannot be told apart to the hundredth as
+            # floats anyway), so we draw floats and round them instead.
+            values = np.round(rng.uniform(self.min_value, self.max_value, n), 2)
+        return values.astype(self._dtype, copy=False)
+
+    def with_nulls(self, values: np.ndarray, mask: np.ndarray) -> pd.arrays.FloatingArray:
+        """
+        Wraps the floats in a nullable float array, masked wherever `mask` is True.
+        """
+        return pd.arrays.FloatingArray(values, mask)
     
 
 @Datatype.register("category")
@@ -135,6 +269,8 @@ class CategoryType(Datatype):
     """
     A class representing a categorical data type.
     """
+    __slots__ = ("categories", "_codes_dtype")
+
     def __init__(self, categories: list = ["A", "B", "C"]):
         """
         Initializes the CategoryType object with a specified list of categories.
@@ -142,13 +278,32 @@ class CategoryType(Datatype):
         super().__init__()
         if categories is None or len(categories) == 0:
             raise ValueError("Categories cannot be None.")
-        self.categories = list(set(categories))
+        # Deduplicate while keeping the given order, so seeded output is reproducible.
+        self.categories = list(dict.fromkeys(categories))
+        # Use the narrowest integer type which can hold a code for every category.
+        n_categories = len(self.categories)
+        self._codes_dtype = np.int8 if n_categories < 128 else np.int16 if n_categories < 32768 else np.int32
 
     def generator_rule(self):
         """
         Generates a random category from the specified list of categories.
         """
-        return random.choice(self.categories) if self.categories else None
+        return _random.choice(self.categories) if self.categories else None
+
+    def generate_array(self, n: int, rng: np.random.Generator) -> pd.Categorical:
+        """
+        Generates an array of `n` random categories from the specified list of categories.
+        """
+        # Sample integer codes rather than the categories themselves, so no strings are touched.
+        codes = rng.integers(0, len(self.categories), n, dtype=self._codes_dtype)
+        return pd.Categorical.from_codes(codes, categories=self.categories)
+
+    def with_nulls(self, values: pd.Categorical, mask: np.ndarray) -> pd.Categorical:
+        """
+        Sets the categories to null wherever `mask` is True, keeping the categorical dtype.
+        """
+        values[mask] = np.nan
+        return values
     
 
 @Datatype.register("boolean")
@@ -156,6 +311,8 @@ class BooleanType(Datatype):
     """
     A class representing a boolean data type.
     """
+    __slots__ = ()
+
     def __init__(self):
         """
         Initializes the BooleanType object.
@@ -166,4 +323,16 @@ class BooleanType(Datatype):
         """
         Generates a random boolean value (True or False).
         """
-        return random.choice([True, False])
\ No newline at end of file
+        return _random.getrandbits(1) == 1
+
+    def generate_array(self, n: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Generates an array of `n` random boolean values.
+        """
+        return rng.integers(0, 2, n, dtype=bool)
+
+    def with_nulls(self, values: np.ndarray, mask: np.ndarray) -> pd.arrays.BooleanArray:
+        """
+        Wraps the booleans in a nullable boolean array, masked wherever `mask` is True.
+        """
+        return pd.arrays.BooleanArray(values, mask)
@@ -8,26 +8,49 @@ if src_dir not in sys.path:
     sys.path.append(src_dir)
 
 from typing import List, Optional, Union
+from multiprocessing import Pool
+import numpy as np
 import pandas as pd
 from data_engine.column_schema import ColumnSchema
 
 
+def _generate_chunk(args: tuple) -> pd.DataFrame:
+    """
+    Generates one chunk of a table in a worker process. Takes a tuple of (table_schema, num_rows, rng).
+    """
+    table_schema, num_rows, rng = args
+    return table_schema._generate_frame(num_rows, rng)
+
+
 class TableSchema:
     """"
     A TableSchema defines the columns in a table. It is a construction of a collection of ColumnSchema objects.
+    An optional `seed` (or an existing `np.random.Generator`) can be given to make the generated data reproducible.
     """
-    def __init__(self, columns: Optional[List[ColumnSchema]] = None):
+    # Below this many rows, starting the worker processes and sending each chunk back to the parent
+    # costs about as much as generating the rows in parallel saves.
+    parallel_threshold: int = 500_000
+
+    def __init__(
+        self,
+        columns: Optional[List[ColumnSchema]] = None,
+        seed: Optional[Union[int, np.random.Generator]] = None,
+    ):
         self.columns = columns
+        self._rng = np.random.default_rng(seed)
 
     def __str__(self):
         return f"TableSchema(columns={self.columns})"
 
-    def generate(self, num_rows: int = 10) -> pd.DataFrame:
+    def generate(self, num_rows: int = 10, n_workers: Optional[int] = None) -> pd.DataFrame:
         """
         Generates a representation of the table with the specified number of rows.
 
         Args:
             num_rows (int): The number of rows to generate.
+            n_workers (int): The number of processes to split generation across, capped at the number of
+                CPUs. Only used when `num_rows` is at least `parallel_threshold`. Every column (including
+                any generator rule) must be picklable to generate in parallel.
 
         Raises:
             ValueError: If no columns are defined in the table schema.
@@ -35,14 +58,28 @@ class TableSchema:
         if self.columns is None:
             raise ValueError("No columns defined in the table schema.")
 
+        if n_workers is not None:
+            n_workers = min(n_workers, os.cpu_count() or 1)
+        if n_workers is None or n_workers <= 1 or num_rows < self.parallel_threshold:
+            return self._generate_frame(num_rows, self._rng)
+
+        # Each worker generates an independent chunk of rows from its own child generator,
+        # spawned from ours so that the streams do not overlap and seeding is still honoured.
+        chunk_sizes = [len(c) for c in np.array_split(np.arange(num_rows), n_workers)]
+        rngs = self._rng.spawn(n_workers)
+        with Pool(n_workers) as pool:
+            chunks = pool.map(_generate_chunk, [(self, size, rng) for size, rng in zip(chunk_sizes, rngs)])
+        return pd.concat(chunks, ignore_index=True)
+
+    def _generate_frame(self, num_rows: int, rng: np.random.Generator) -> pd.DataFrame:
+        """
+        Generates a DataFrame with the specified number of rows using the given random generator.
+        """
+        # Generate whole columns at once, each already in its target dtype, so that pandas
+        # can take the arrays as they are rather than transposing a list of rows.
         col_names = [c.name for c in self.columns]
-        count = 0
-        data = []
-        while count < num_rows:
-            row = [c.generate() for c in self.columns]
-            data.append(row)
-            count += 1
-        return pd.DataFrame(data, columns=col_names)
+        col_arrays = [c.generate_array(num_rows, rng) for c in self.columns]
+        return pd.DataFrame({name: col_array for name, col_array in zip(col_names, col_arrays)}, copy=False)
     
     def add_column(self, column: ColumnSchema | str) -> None:
         """
@@ -71,26 +108,44 @@ class TableSchema:
         if self.columns is None:
             cols = []
         cols = [col for col in self.columns if col.name in column_names]
-        return TableSchema(cols)
+        # Give the selection its own generator spawned from ours, so that it is seeded whenever we are.
+        return TableSchema(cols, seed=self._rng.spawn(1)[0])
 
     @classmethod
-    def from_dataframe(cls, df: pd.DataFrame) -> "TableSchema":
+    def from_dataframe(cls, df: pd.DataFrame, column_cache: Optional[dict] = None) -> "TableSchema":
         """
         Creates a TableSchema object from a DataFrame.
+
+        Args:
+            df (pd.DataFrame): The schema definition, with one row per column.
+            column_cache (dict): An optional cache of ColumnSchema objects keyed on the row values they
+                were built from. Rows which are unchanged since a previous call reuse the cached column
+                instead of constructing a new one. The cache is updated in place to hold only the columns
+                of this DataFrame, so it never grows beyond the size of the schema.
         """
+        # Read the rows as plain dicts rather than via iterrows, which builds a Series per row.
+        # Missing values are replaced with None for the whole frame at once; casting to object first
+        # stops float columns from turning None back into NaN.
         columns = []
-        for _, r in df.iterrows():
-            row = {k: (v if pd.notna(v) else None) for k, v in r.items()}
-            col = ColumnSchema(
-                name=row["name"],
-                datatype=row["datatype"],
-                length=row["length"],
-                domain=row["domain"],
-                max_value=row["max"],
-                min_value=row["min"],
-                completeness=row["completeness"]
-            )
+        built = {}
+        for row in df.astype(object).where(df.notna(), None).to_dict(orient="records"):
+            key = (row["name"], row["datatype"], row["length"], row["domain"], row["max"], row["min"], row["completeness"])
+            col = column_cache.get(key) if column_cache is not None else None
+            if col is None:
+                col = ColumnSchema(
+                    name=row["name"],
+                    datatype=row["datatype"],
+                    length=row["length"],
+                    domain=row["domain"],
+                    max_value=row["max"],
+                    min_value=row["min"],
+                    completeness=row["completeness"]
+                )
+            built[key] = col
             columns.append(col)
+        if column_cache is not None:
+            column_cache.clear()
+            column_cache.update(built)
         table_schema = cls(columns)
         return table_schema
 